@@ -7,10 +7,31 @@
 # Data Src : Google Form → Excel (real-world messy headers)
 # ============================================================
 
-from flask import Flask, render_template, request
+from flask import (
+    Flask, Response, abort, g, jsonify, make_response,
+    render_template, request, url_for,
+)
+import click
+from openpyxl import Workbook
 import pandas as pd
+import numpy as np
+import base64
+import csv
+import hashlib
+import io
+import json
+import os
 import re
-from collections import Counter, defaultdict
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import NamedTuple
+from urllib.parse import quote
 
 # ============================================================
 # FLASK APP INIT
@@ -22,7 +43,23 @@ app = Flask(__name__)
 # EXCEL CONFIGURATION
 # ============================================================
 
-EXCEL_FILE = "NFSU Tripura Campus Sports Day (Responses).xlsx"
+EXCEL_FILE = os.environ.get(
+    "SPORTS_DAY_EXCEL", "NFSU Tripura Campus Sports Day (Responses).xlsx"
+)
+
+# Seconds between workbook change checks (0 disables hot reload)
+RELOAD_INTERVAL = float(os.environ.get("SPORTS_DAY_RELOAD_INTERVAL", "5"))
+
+# Parsed-data cache directory shared by all workers ("" disables it)
+CACHE_DIR = os.environ.get("SPORTS_DAY_CACHE_DIR", os.path.join(".cache", "sportsday"))
+
+# SQLite store built by `flask --app app ingest` ("" = workbook only)
+DB_PATH = os.environ.get("SPORTS_DAY_DB", "")
+DEFAULT_EVENT = os.environ.get("SPORTS_DAY_EVENT", "")
+
+# With a store, the workbook (and its workbook-only routes) is loaded
+# only when SPORTS_DAY_EXCEL is set explicitly
+LOAD_WORKBOOK = not DB_PATH or "SPORTS_DAY_EXCEL" in os.environ
 
 COL_NAME   = "Full Name"
 COL_PHONE  = "Phone Number"
@@ -32,42 +69,759 @@ COL_GENDER = "Gender"
 COL_SPORT  = "Select the Sports You Want to Participate In"
 COL_TEAM   = "Sports ( Team)"
 
-# ============================================================
-# LOAD DATA
-# ============================================================
-
-df = pd.read_excel(EXCEL_FILE)
-df.columns = df.columns.str.strip()
-df = df.fillna("")
-
 # ============================================================
 # NORMALIZATION
 # ============================================================
 
+PUNCT_RE = re.compile(r"[^\w\s\-]")
+SPACE_RE = re.compile(r"\s+")
+
 def normalize(text):
     text = str(text).lower()
     text = text.replace("–", "-")
-    text = re.sub(r"[^\w\s\-]", "", text)
-    text = re.sub(r"\s+", " ", text)
+    text = PUNCT_RE.sub("", text)
+    text = SPACE_RE.sub(" ", text)
     return text.strip()
 
-df["SPORT_NORM"] = df[COL_SPORT].apply(normalize)
-df["TEAM_NORM"]  = df[COL_TEAM].apply(normalize)
+def normalize_series(series):
+    """``series.apply(normalize)`` without the per-row Python calls.
+
+    Form columns repeat a handful of values (semesters, branches,
+    multi-select combinations), so each distinct value is normalized
+    once with ``.str`` ops and the result is broadcast back by code.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    text = pd.Series(uniques.astype(str), dtype="string[python]")
+    text = (
+        text.str.lower()
+            .str.replace("–", "-", regex=False)
+            .str.replace(PUNCT_RE, "", regex=True)
+            .str.replace(SPACE_RE, " ", regex=True)
+            .str.strip()
+    )
+    values = text.to_numpy(dtype=object)[codes]
+    return pd.Series(values, index=series.index, name=series.name, dtype="str")
 
 # ============================================================
 # NORMALIZED COLUMN MAP
 # ============================================================
 
-NORMALIZED_COLUMNS = {
-    normalize(col): col for col in df.columns
-}
-
-def find_column_by_keywords(keywords):
-    for norm_col, original_col in NORMALIZED_COLUMNS.items():
+def find_column_by_keywords(keywords, columns=None):
+    if columns is None:
+        columns = current_snapshot().normalized_columns
+    for norm_col, original_col in columns.items():
         if all(k in norm_col for k in keywords):
             return original_col
     return None
 
+# ============================================================
+# EVENT INDEX (SPORT / TEAM EVENT → ROW POSITIONS)
+# ------------------------------------------------------------
+# Google Form multi-select cells look like
+#   "🏃 Athletics – Sprint (100 m), 🏏 Cricket, ♟️Chess"
+# Each comma separated choice is normalized into a canonical
+# event name and mapped to the row positions that picked it.
+# ============================================================
+
+def split_events(cell):
+    events = []
+    for part in str(cell).split(","):
+        event = normalize(part)
+        if event and event not in events:
+            events.append(event)
+    return events
+
+class EventIndex:
+    """Inverted index from canonical event name to row positions.
+
+    ``lookup(key)`` returns the same rows as
+    ``column.apply(normalize).str.contains(key)`` for any key that
+    falls inside a single selected option (which is every option the
+    form can produce), without scanning the frame.
+    """
+
+    MEMO_LIMIT = 1024
+
+    def __init__(self, cells):
+        # tokenise each distinct cell once, then expand codes to rows
+        codes, uniques = pd.factorize(pd.Series(cells), use_na_sentinel=False)
+        cell_ids = defaultdict(list)
+        for code, cell in enumerate(uniques):
+            for event in split_events(cell):
+                cell_ids[event].append(code)
+
+        self.size = len(codes)
+        self.postings = {
+            event: np.flatnonzero(np.isin(codes, ids))
+            for event, ids in cell_ids.items()
+        }
+        self._memo = {}
+
+    def events_matching(self, key):
+        return [event for event in self.postings if key in event]
+
+    def lookup(self, key):
+        if key in self._memo:
+            return self._memo[key]
+
+        if not key:
+            # str.contains("") matches every row, empty cells included
+            rows = np.arange(self.size, dtype=np.intp)
+        else:
+            matches = [self.postings[e] for e in self.events_matching(key)]
+            if matches:
+                rows = np.unique(np.concatenate(matches))
+            else:
+                rows = np.empty(0, dtype=np.intp)
+
+        if len(self._memo) >= self.MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[key] = rows
+        return rows
+
+# ============================================================
+# AGGREGATION CUBE
+# ------------------------------------------------------------
+# Built once per snapshot from the event indexes: one cell per
+# (type, event, branch, semester, gender) with its entry count.
+# Any slice or roll-up is a mask + bincount over a few thousand
+# cells instead of a scan over the responses.
+# ============================================================
+
+CUBE_DIMENSIONS = ("type", "event", "branch", "semester", "gender")
+
+class AggregationCube:
+    """Entry counts per (type, event, branch, semester, gender).
+
+    An entry is one participant selecting one sport (type "sport")
+    or team event (type "team"). Within one event a count is a
+    number of participants; summed over events it counts entries.
+    """
+
+    MEMO_LIMIT = 256
+
+    def __init__(self, df, sport_index, team_index):
+        self.labels = {"type": ["sport", "team"], "event": []}
+        attr_codes = {}
+        for dim, col in (("branch", COL_BRANCH), ("semester", COL_SEM), ("gender", COL_GENDER)):
+            codes, labels = pd.factorize(df[col].astype(str), sort=True)
+            attr_codes[dim] = codes
+            self.labels[dim] = labels.tolist()
+
+        event_ids = {}
+        rows, types, events = [], [], []
+        for type_id, index in enumerate((sport_index, team_index)):
+            for event, positions in index.postings.items():
+                if event not in event_ids:
+                    event_ids[event] = len(self.labels["event"])
+                    self.labels["event"].append(event)
+                rows.append(positions)
+                types.append(np.full(len(positions), type_id))
+                events.append(np.full(len(positions), event_ids[event]))
+
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        entry_codes = [
+            np.concatenate(types) if types else rows,
+            np.concatenate(events) if events else rows,
+            attr_codes["branch"][rows],
+            attr_codes["semester"][rows],
+            attr_codes["gender"][rows],
+        ]
+        shape = self._shape(CUBE_DIMENSIONS)
+        cells, self.counts = np.unique(
+            np.ravel_multi_index(entry_codes, shape), return_counts=True
+        )
+        self.codes = dict(zip(CUBE_DIMENSIONS, np.unravel_index(cells, shape)))
+        self.ids = {
+            dim: {label: i for i, label in enumerate(labels)}
+            for dim, labels in self.labels.items()
+        }
+        self._memo = {}
+
+    def _shape(self, dims):
+        return tuple(max(len(self.labels[dim]), 1) for dim in dims)
+
+    def query(self, filters=None, group_by=()):
+        """Sum entry counts over the cells matching ``filters``
+        (dimension → accepted labels), grouped by ``group_by``."""
+        filters = filters or {}
+        memo_key = (
+            tuple(sorted((dim, tuple(values)) for dim, values in filters.items())),
+            tuple(group_by),
+        )
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        mask = np.ones(len(self.counts), dtype=bool)
+        for dim, values in filters.items():
+            ids = [self.ids[dim][v] for v in values if v in self.ids[dim]]
+            mask &= np.isin(self.codes[dim], ids)
+        counts = self.counts[mask]
+
+        rows = []
+        if group_by:
+            shape = self._shape(group_by)
+            keys = np.ravel_multi_index([self.codes[d][mask] for d in group_by], shape)
+            groups, inverse = np.unique(keys, return_inverse=True)
+            sums = np.bincount(inverse, weights=counts, minlength=len(groups))
+            cells = np.unravel_index(groups, shape)
+            for j, total in enumerate(sums):
+                row = {dim: self.labels[dim][cells[i][j]] for i, dim in enumerate(group_by)}
+                row["count"] = int(total)
+                rows.append(row)
+
+        result = {"total": int(counts.sum()), "rows": rows}
+        if len(self._memo) >= self.MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[memo_key] = result
+        return result
+
+# ============================================================
+# PARTICIPANT LOOKUP (TRIGRAM INDEX)
+# ------------------------------------------------------------
+# Names are indexed by word trigrams padded like pg_trgm
+# ("  rah", "rahul " → "  r", " ra", "rah", ...), phones by digit
+# trigrams. A query scores every candidate by shared trigrams
+# with one bincount, so typos and partial numbers still match.
+# ============================================================
+
+def word_trigrams(text, prefix=False):
+    """Trigrams of each word; with ``prefix`` the last word is left
+    open-ended so a half-typed word matches longer names."""
+    words = text.split()
+    grams = set()
+    for i, word in enumerate(words):
+        padded = "  " + word + ("" if prefix and i == len(words) - 1 else " ")
+        grams.update(padded[j:j + 3] for j in range(len(padded) - 2))
+    return grams
+
+def digit_trigrams(digits):
+    return {digits[j:j + 3] for j in range(len(digits) - 2)}
+
+def phone_digits(series):
+    text = series.astype(str).str.replace(r"\.0$", "", regex=True)
+    return text.str.replace(r"\D", "", regex=True)
+
+class TrigramIndex:
+    """Trigram postings over the distinct values of one column."""
+
+    def __init__(self, values, grams):
+        self.codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        self.values = list(uniques)
+        self.sizes = np.zeros(len(self.values), dtype=np.int32)
+
+        postings = defaultdict(list)
+        for uid, value in enumerate(self.values):
+            value_grams = grams(value)
+            self.sizes[uid] = len(value_grams)
+            for gram in value_grams:
+                postings[gram].append(uid)
+        self.postings = {
+            gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+
+        # rows holding each distinct value: order[starts[u]:starts[u + 1]]
+        self.order = np.argsort(self.codes, kind="stable")
+        self.starts = np.concatenate((
+            [0], np.cumsum(np.bincount(self.codes, minlength=len(self.values)))
+        ))
+
+    def rows(self, uid):
+        return self.order[self.starts[uid]:self.starts[uid + 1]]
+
+    def search(self, query_grams, min_coverage):
+        """Distinct-value ids sharing at least ``min_coverage`` of the
+        query trigrams, with their coverage and Jaccard similarity."""
+        hits = [self.postings[g] for g in query_grams if g in self.postings]
+        if not hits:
+            empty = np.empty(0)
+            return empty.astype(np.intp), empty, empty
+
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.values))
+        ids = np.flatnonzero(shared >= min_coverage * len(query_grams))
+        matched = shared[ids]
+        coverage = matched / len(query_grams)
+        jaccard = matched / (len(query_grams) + self.sizes[ids] - matched)
+        return ids, coverage, jaccard
+
+class PeopleIndex:
+
+    NAME_COVERAGE = 0.5
+    PHONE_COVERAGE = 0.6
+
+    def __init__(self, df):
+        self.names = TrigramIndex(normalize_series(df[COL_NAME]), word_trigrams)
+        self.phones = TrigramIndex(phone_digits(df[COL_PHONE]), digit_trigrams)
+
+    def search(self, query, limit=10):
+        """Row positions of the best matches for a name or phone query."""
+        digits = re.sub(r"\D", "", query)
+        compact = re.sub(r"\s", "", query)
+
+        if len(digits) >= 3 and len(digits) >= 0.8 * len(compact):
+            index = self.phones
+            ids, coverage, jaccard = index.search(digit_trigrams(digits), self.PHONE_COVERAGE)
+            exact = np.fromiter(
+                (digits in index.values[i] for i in ids), dtype=bool, count=len(ids)
+            )
+            score = coverage + 0.5 * jaccard + exact
+        else:
+            index = self.names
+            grams = word_trigrams(normalize(query), prefix=True)
+            if not grams:
+                return [], []
+            ids, coverage, jaccard = index.search(grams, self.NAME_COVERAGE)
+            score = coverage + 0.5 * jaccard
+
+        if len(ids) > limit:
+            top = np.argpartition(-score, limit - 1)[:limit]
+        else:
+            top = np.arange(len(ids))
+        top = top[np.argsort(-score[top], kind="stable")]
+
+        rows, scores = [], []
+        for i in top:
+            for row in index.rows(ids[i]):
+                rows.append(int(row))
+                scores.append(float(score[i]))
+        return rows[:limit], scores[:limit]
+
+# ============================================================
+# COLUMNAR CACHE
+# ------------------------------------------------------------
+# Parsing the workbook with openpyxl dominates startup. The
+# cleaned frame is written once per workbook content hash as
+# one .npy file per column, and every later load (any worker,
+# any restart) reads those files instead:
+#   numbers / datetimes → native arrays, memory-mapped
+#   text                → UTF-8 bytes joined by "\0", decoded
+#                         into each process's own str objects
+#   mixed values        → the same text plus a uint8 type tag
+#                         per cell (never pickled)
+# Only native columns stay shared pages; text (most of a form
+# export) costs every process its own copy, so sharing across
+# gunicorn workers comes from preload_app, not from this cache.
+# ============================================================
+
+CACHE_FORMAT = 2
+CACHE_KEEP = 3
+
+# only entries named like cache_dir_for() output are ever pruned
+CACHE_ENTRY_RE = re.compile(r"^[0-9a-f]{32}-v\d+$")
+
+# tag → (types, encode, decode) for cells of mixed columns;
+# bool before int, since bool is an int subclass
+MIXED_TYPES = (
+    (str, str, str),
+    ((bool, np.bool_), lambda v: "1" if v else "0", lambda t: t == "1"),
+    ((int, np.integer), str, int),
+    (float, repr, float),
+    (datetime, lambda v: v.isoformat(), datetime.fromisoformat),
+)
+
+def workbook_digest(path=EXCEL_FILE):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_dir_for(digest):
+    return os.path.join(CACHE_DIR, f"{digest[:32]}-v{CACHE_FORMAT}")
+
+def _column_kind(series):
+    if series.dtype != object and not pd.api.types.is_string_dtype(series):
+        return "native"
+    if all(isinstance(v, str) and "\0" not in v for v in series):
+        return "text"
+    return "mixed"
+
+def _encode_mixed(series):
+    tags, texts = [], []
+    for value in series:
+        for tag, (types, encode, _) in enumerate(MIXED_TYPES):
+            if isinstance(value, types):
+                break
+        else:
+            raise ValueError(f"cannot cache {type(value).__name__} values")
+        text = encode(value)
+        if "\0" in text:
+            raise ValueError("cannot cache text containing NUL")
+        tags.append(tag)
+        texts.append(text)
+    return np.array(tags, dtype=np.uint8), texts
+
+def _save_text(path, values):
+    blob = "\0".join(values).encode("utf-8")
+    np.save(path, np.frombuffer(blob, dtype=np.uint8))
+
+def write_frame_cache(df, digest):
+    """Raises OSError, or ValueError for a cell that cannot be encoded."""
+    target = cache_dir_for(digest)
+    if os.path.isdir(target):
+        return target
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".tmp-", dir=CACHE_DIR)
+    meta = {"rows": len(df), "columns": []}
+
+    try:
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            kind = _column_kind(series)
+            path = os.path.join(tmp, f"{i:03d}.npy")
+
+            if kind == "text":
+                _save_text(path, series.tolist())
+            elif kind == "mixed":
+                tags, texts = _encode_mixed(series)
+                _save_text(path, texts)
+                np.save(os.path.join(tmp, f"{i:03d}.tags.npy"), tags)
+            else:
+                np.save(path, series.to_numpy())
+
+            meta["columns"].append(
+                {"name": col, "kind": kind, "dtype": str(series.dtype)}
+            )
+
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # another worker published the same digest first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    prune_frame_cache(keep=target)
+    return target
+
+def _load_mapped(path):
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # zero-length arrays cannot be mapped
+        return np.load(path)
+
+def _load_text(path, rows):
+    return bytes(_load_mapped(path)).decode("utf-8").split("\0") if rows else []
+
+def read_frame_cache(digest):
+    target = cache_dir_for(digest)
+    try:
+        with open(os.path.join(target, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        data = {}
+        for i, column in enumerate(meta["columns"]):
+            path = os.path.join(target, f"{i:03d}.npy")
+
+            if column["kind"] == "text":
+                values = _load_text(path, meta["rows"])
+                data[column["name"]] = pd.Series(values, dtype=column["dtype"])
+            elif column["kind"] == "mixed":
+                tags = np.load(os.path.join(target, f"{i:03d}.tags.npy"))
+                texts = _load_text(path, meta["rows"])
+                values = [MIXED_TYPES[tag][2](text) for tag, text in zip(tags, texts)]
+                data[column["name"]] = pd.Series(values, dtype=object)
+            else:
+                data[column["name"]] = pd.Series(_load_mapped(path))
+    except (OSError, ValueError, KeyError, IndexError):
+        # missing, torn or foreign files are a cache miss, never unpickled
+        return None
+
+    return pd.DataFrame(data)
+
+def prune_frame_cache(keep):
+    entries = [
+        os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR)
+        if CACHE_ENTRY_RE.match(name)
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[CACHE_KEEP:]:
+        if path != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+# ============================================================
+# METRICS
+# ------------------------------------------------------------
+# Small in-process histograms / counters rendered in the
+# Prometheus text format at /metrics. Each gunicorn worker
+# keeps its own numbers; scrape every worker (or sum them).
+# ============================================================
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _label_text(names, values, extra=""):
+    pairs = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class HistogramMetric:
+
+    def __init__(self, name, doc, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, *labels):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[0][i] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    @contextmanager
+    def time(self, *labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def totals(self):
+        """``{labels: (sum, count)}`` for quick summaries."""
+        with self._lock:
+            return {labels: (s[1], s[2]) for labels, s in self._series.items()}
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (buckets, total, count) in sorted(self._series.items()):
+                for bound, n in zip(self.buckets, buckets):
+                    le = _label_text(self.labelnames, labels, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{le} {n}")
+                le = _label_text(self.labelnames, labels, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{le} {count}")
+                text = _label_text(self.labelnames, labels)
+                lines.append(f"{self.name}_sum{text} {total}")
+                lines.append(f"{self.name}_count{text} {count}")
+        return lines
+
+class CounterMetric:
+
+    def __init__(self, name, doc, labelnames=()):
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._values = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] += amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, labels)} {value}")
+        return lines
+
+def sample_lines(kind, name, doc, samples):
+    """Values read from elsewhere (cache stats, the snapshot) as a
+    ``kind`` metric; ``samples`` is a list of ``(labelnames, labels, value)``."""
+    lines = [f"# HELP {name} {doc}", f"# TYPE {name} {kind}"]
+    for labelnames, labels, value in samples:
+        lines.append(f"{name}{_label_text(labelnames, labels)} {value}")
+    return lines
+
+REQUEST_SECONDS = HistogramMetric(
+    "sportsday_request_seconds", "Request latency by endpoint.", ["endpoint"]
+)
+RESPONSES = CounterMetric(
+    "sportsday_responses_total", "Responses by endpoint and status code.",
+    ["endpoint", "status"],
+)
+SEARCH_STAGE_SECONDS = HistogramMetric(
+    "sportsday_search_stage_seconds",
+    "Time spent in each /search stage (cache misses only).", ["stage"],
+)
+LOAD_STAGE_SECONDS = HistogramMetric(
+    "sportsday_load_stage_seconds",
+    "Time spent in each stage of loading a data snapshot.", ["stage"],
+)
+
+# ============================================================
+# LOAD DATA
+# ------------------------------------------------------------
+# Everything a request needs is bundled into one immutable
+# DataSnapshot. Handlers read current_snapshot() once and use
+# only that object, so a reload swapping in a new snapshot can
+# never hand them a half-built frame.
+# ============================================================
+
+class DataSnapshot(NamedTuple):
+    version: int
+    digest: str
+    df: pd.DataFrame
+    normalized_columns: dict
+    sport_index: EventIndex
+    team_index: EventIndex
+    cube: AggregationCube
+    people: PeopleIndex
+    source_stat: tuple
+    loaded_at: float
+    load_seconds: float
+
+def workbook_stat(path=EXCEL_FILE):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def parse_workbook(path=EXCEL_FILE):
+    df = pd.read_excel(path)
+    df.columns = df.columns.str.strip()
+    df = df.fillna("")
+
+    df["SPORT_NORM"] = normalize_series(df[COL_SPORT])
+    df["TEAM_NORM"]  = normalize_series(df[COL_TEAM])
+    return df
+
+def load_frame(path=EXCEL_FILE):
+    """The cleaned frame and the workbook's content digest."""
+    digest = workbook_digest(path)
+    if not CACHE_DIR:
+        return parse_workbook(path), digest
+
+    df = read_frame_cache(digest)
+    if df is None:
+        df = parse_workbook(path)
+        try:
+            write_frame_cache(df, digest)
+        except (OSError, ValueError) as exc:
+            app.logger.warning("Could not write data cache to %s: %s", CACHE_DIR, exc)
+    return df, digest
+
+def build_snapshot(df, version, digest, source_stat, started):
+    with LOAD_STAGE_SECONDS.time("event_index"):
+        sport_index = EventIndex(df[COL_SPORT])
+        team_index = EventIndex(df[COL_TEAM])
+    with LOAD_STAGE_SECONDS.time("cube"):
+        cube = AggregationCube(df, sport_index, team_index)
+    with LOAD_STAGE_SECONDS.time("people_index"):
+        people = PeopleIndex(df)
+
+    snapshot = DataSnapshot(
+        version=version,
+        digest=digest,
+        df=df,
+        normalized_columns={normalize(col): col for col in df.columns},
+        sport_index=sport_index,
+        team_index=team_index,
+        cube=cube,
+        people=people,
+        source_stat=source_stat,
+        loaded_at=time.time(),
+        load_seconds=0.0,
+    )
+    snapshot = snapshot._replace(load_seconds=time.perf_counter() - started)
+    LOAD_STAGE_SECONDS.observe(snapshot.load_seconds, "total")
+    return snapshot
+
+_snapshot = None
+_publish_lock = threading.Lock()
+
+def current_snapshot():
+    return _snapshot
+
+def workbook_snapshot():
+    """current_snapshot() for workbook-only routes; 404 when the
+    workbook is not loaded (a store-only deployment)."""
+    snap = current_snapshot()
+    if snap is None:
+        abort(404)
+    return snap
+
+def load_snapshot(path=EXCEL_FILE):
+    """Parse the workbook and publish it as the next snapshot.
+
+    Returns the new snapshot, or None when the file changed while it
+    was being read (the next check picks up the finished write).
+    """
+    global _snapshot
+
+    started = time.perf_counter()
+    before = workbook_stat(path)
+    with LOAD_STAGE_SECONDS.time("read"):
+        df, digest = load_frame(path)
+    if workbook_stat(path) != before:
+        return None
+
+    with _publish_lock:
+        version = _snapshot.version + 1 if _snapshot else 1
+        snapshot = build_snapshot(df, version, digest, before, started)
+        _snapshot = snapshot
+
+    app.logger.info(
+        "Loaded %s: version %d, %d rows in %.3fs",
+        path, snapshot.version, len(df), snapshot.load_seconds
+    )
+    return snapshot
+
+# ============================================================
+# HOT RELOAD
+# ------------------------------------------------------------
+# Polls the workbook's mtime/size and re-parses it off the
+# request path. A failed or torn read keeps the old snapshot.
+# ============================================================
+
+class WorkbookWatcher(threading.Thread):
+
+    def __init__(self, path=EXCEL_FILE, interval=RELOAD_INTERVAL):
+        super().__init__(name="workbook-watcher", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                snapshot = current_snapshot()
+                if snapshot and workbook_stat(self.path) == snapshot.source_stat:
+                    continue
+                load_snapshot(self.path)
+            except Exception:
+                app.logger.exception("Reloading %s failed", self.path)
+
+    def stop(self):
+        self.stopped.set()
+
+_watcher = None
+
+def start_watcher():
+    # threads do not survive fork(), so a forked worker starts its own
+    global _watcher
+    if not LOAD_WORKBOOK:
+        return None
+    if RELOAD_INTERVAL > 0 and (_watcher is None or not _watcher.is_alive()):
+        _watcher = WorkbookWatcher()
+        _watcher.start()
+    return _watcher
+
+while LOAD_WORKBOOK and load_snapshot() is None:
+    time.sleep(0.5)
+
+# gunicorn.conf.py turns this off and starts the watcher per worker
+if os.environ.get("SPORTS_DAY_WATCH_ON_IMPORT", "1") == "1":
+    start_watcher()
+
 # ============================================================
 # SEMESTER SORT
 # ============================================================
@@ -82,20 +836,43 @@ def semester_key(val):
     val = normalize(val).replace("semester", "")
     return SEM_MAP.get(val, 99)
 
+def semester_keys(series):
+    """``series.apply(semester_key)`` as a categorical lookup.
+
+    The column is factorized into its few distinct labels, each label
+    is ranked once, and the ordinals are gathered back by code.
+    """
+    codes, labels = pd.factorize(series, use_na_sentinel=False)
+    ordinals = np.array([semester_key(label) for label in labels], dtype=np.int64)
+    return pd.Series(ordinals[codes], index=series.index, name=series.name)
+
 # ============================================================
 # GROUPING
 # ============================================================
 
-def group_by_branch(data):
-    data = data.copy()
-    data["_SEM_KEY"] = data[COL_SEM].apply(semester_key)
+def branch_ordered(data):
+    """Rows in the order group_by_branch() lays them out: branches
+    sorted, semester order within each branch, numbered by SNO."""
+    data = data.assign(_SEM_KEY=semester_keys(data[COL_SEM]))
     data = data.sort_values("_SEM_KEY")
+    data["SNO"] = data.groupby(COL_BRANCH).cumcount() + 1
+
+    groups = data.groupby(COL_BRANCH).indices
+    if not groups:
+        return data
+    return data.take(np.concatenate(list(groups.values())))
+
+def group_by_branch(data):
+    data = branch_ordered(data)
+
+    # column-wise tolist() + zip builds the same dicts as
+    # to_dict("records") without its per-cell boxing
+    columns = list(data.columns)
+    records = zip(*(data[col].tolist() for col in columns))
 
     grouped = defaultdict(list)
-    for branch, rows in data.groupby(COL_BRANCH):
-        for i, row in enumerate(rows.to_dict("records"), start=1):
-            row["SNO"] = i
-            grouped[branch].append(row)
+    for branch, values in zip(data[COL_BRANCH].tolist(), records):
+        grouped[branch].append(dict(zip(columns, values)))
 
     return dict(grouped)
 
@@ -115,116 +892,1009 @@ def semester_chart(data):
 
 @app.route("/")
 def home():
-    return render_template("index.html")
+    # the lookup card and dashboard read the workbook snapshot
+    return render_template("index.html", workbook_tools=current_snapshot() is not None)
+
+@app.route("/data/version")
+def data_version():
+    snap = workbook_snapshot()
+    mtime_ns, size = snap.source_stat
+    # `digest` identifies the data across workers and restarts;
+    # `version` only counts reloads inside this process
+    return jsonify(
+        digest=snap.digest,
+        version=snap.version,
+        rows=len(snap.df),
+        loaded_at=snap.loaded_at,
+        load_seconds=round(snap.load_seconds, 4),
+        source={"path": EXCEL_FILE, "mtime": mtime_ns / 1e9, "size": size},
+    )
 
 # ============================================================
-# SEARCH HANDLER
+# ANALYTICS API + DASHBOARD
+# ------------------------------------------------------------
+#   /api/cube?group=event,gender&type=sport&branch=B.Sc–M.Sc
+# `group` lists the dimensions to keep; any dimension given as
+# a parameter (repeatable) filters the cube to those labels.
 # ============================================================
 
-@app.route("/search", methods=["POST"])
-def search():
+@app.route("/api/cube")
+def cube_api():
+    snap = workbook_snapshot()
 
-    individual = request.form.get("sport")
-    team = request.form.get("team_sport")
+    group_by = [d for d in request.args.get("group", "").split(",") if d]
+    unknown = [d for d in group_by if d not in CUBE_DIMENSIONS]
+    if unknown:
+        return jsonify(
+            error=f"Unknown dimension: {', '.join(unknown)}",
+            dimensions=list(CUBE_DIMENSIONS),
+        ), 400
 
-    # --------------------------------------------------------
-    # INDIVIDUAL SPORTS
-    # --------------------------------------------------------
-    if individual:
-        key = normalize(individual).split("(")[0]
-        filtered = df[df["SPORT_NORM"].str.contains(key, na=False)]
+    filters = {
+        dim: request.args.getlist(dim)
+        for dim in CUBE_DIMENSIONS if dim in request.args
+    }
+
+    started = time.perf_counter()
+    result = snap.cube.query(filters, group_by)
+    elapsed = time.perf_counter() - started
+
+    return jsonify(
+        version=snap.version,
+        group=group_by,
+        filters=filters,
+        elapsed_ms=round(elapsed * 1000, 3),
+        **result
+    )
+
+@app.route("/api/cube/dimensions")
+def cube_dimensions():
+    snap = workbook_snapshot()
+    return jsonify(version=snap.version, dimensions=snap.cube.labels)
+
+@app.route("/dashboard")
+def dashboard():
+    workbook_snapshot()
+    return render_template("dashboard.html", dimensions=CUBE_DIMENSIONS)
+
+# ============================================================
+# PARTICIPANTS API + EXPORT
+# ------------------------------------------------------------
+#   /api/participants?sport=Cricket&gender=Female&fields=name,phone
+#   /api/participants?cursor=<next_cursor from the previous page>
+#   /api/participants/export?team_sport=Relay Race&format=xlsx
+# Rows come in group_by_branch() order (branch, then semester)
+# with the same per-branch SNO. The filtered, ordered frame is
+# cached per data version, so paging never re-filters.
+# A cursor carries the workbook digest, the query and the offset,
+# so any worker can continue it and it alone fetches the next page.
+# ============================================================
+
+PARTICIPANT_FIELDS = {
+    "sno":         "SNO",
+    "name":        COL_NAME,
+    "semester":    COL_SEM,
+    "gender":      COL_GENDER,
+    "branch":      COL_BRANCH,
+    "phone":       COL_PHONE,
+    "sports":      COL_SPORT,
+    "team_sports": COL_TEAM,
+}
+
+DEFAULT_FIELDS = ["sno", "name", "semester", "gender", "branch", "phone"]
+
+PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+EXPORT_CHUNK = 500
+
+class BadQuery(ValueError):
+    pass
+
+@app.errorhandler(BadQuery)
+def bad_query(exc):
+    return jsonify(error=str(exc)), 400
+
+PARTICIPANT_FILTERS = ("sport", "team_sport", "branch", "semester", "gender")
+
+def participant_filters():
+    return {
+        name: request.args.get(name, "").strip()
+        for name in PARTICIPANT_FILTERS
+        if request.args.get(name, "").strip()
+    }
+
+def participant_query():
+    """Filters plus the ``fields`` list, as carried by a cursor."""
+    query = participant_filters()
+    fields = request.args.get("fields", "").strip()
+    if fields:
+        query["fields"] = fields
+    return query
+
+def participant_rows(snap, filters):
+    """Filtered participants in branch/semester order, plus the
+    team-members column for a team_sport filter (or None)."""
+    cache_key = ("participants", tuple(sorted(filters.items())), snap.version)
+    cached = PARTICIPANT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    rows = np.arange(len(snap.df), dtype=np.intp)
+    team_col = None
+
+    if "sport" in filters:
+        key = normalize(filters["sport"]).split("(")[0]
+        rows = np.intersect1d(rows, snap.sport_index.lookup(key))
+
+    if "team_sport" in filters:
+        team_norm = normalize(filters["team_sport"])
+        rows = np.intersect1d(rows, snap.team_index.lookup(team_base_key(team_norm)))
+        team_col = team_column_for(team_norm, snap.normalized_columns)
+
+    data = snap.df.take(rows)
+    for name, col in (("branch", COL_BRANCH), ("semester", COL_SEM), ("gender", COL_GENDER)):
+        if name in filters:
+            data = data[normalize_series(data[col]) == normalize(filters[name])]
+
+    result = (branch_ordered(data), team_col)
+    PARTICIPANT_CACHE.put(cache_key, result)
+    return result
+
+def participant_columns(team_col, fields):
+    available = dict(PARTICIPANT_FIELDS)
+    if team_col:
+        available["team_members"] = team_col
+
+    requested = [f for f in fields.split(",") if f]
+    if not requested:
+        requested = DEFAULT_FIELDS + (["team_members"] if team_col else [])
+
+    unknown = [f for f in requested if f not in available]
+    if unknown:
+        raise BadQuery(
+            f"Unknown field: {', '.join(unknown)} "
+            f"(available: {', '.join(available)})"
+        )
+    return requested, [available[f] for f in requested]
+
+def encode_cursor(digest, query, offset, limit):
+    raw = json.dumps(
+        {"d": digest, "q": query, "o": offset, "l": limit}, sort_keys=True
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        digest, query = str(data["d"]), dict(data["q"])
+        offset, limit = int(data["o"]), int(data["l"])
+    except (ValueError, KeyError, TypeError):
+        raise BadQuery("Invalid cursor")
+    if offset < 0 or not all(
+        k in PARTICIPANT_FILTERS + ("fields",) and isinstance(v, str)
+        for k, v in query.items()
+    ):
+        raise BadQuery("Invalid cursor")
+    return digest, query, offset, limit
+
+def page_limit(default, maximum=MAX_PAGE_LIMIT):
+    try:
+        limit = min(int(request.args.get("limit", default)), maximum)
+    except ValueError:
+        raise BadQuery("limit must be an integer")
+    if limit < 1:
+        raise BadQuery("limit must be positive")
+    return limit
+
+def column_values(data, col):
+    # cells of mixed columns (Phone Number) come back as int or str;
+    # give every field one type, stripped like participant_summary()
+    if col == "SNO":
+        return data[col].tolist()
+    return [str(v).strip() for v in data[col].tolist()]
+
+def page_records(data, names, columns):
+    values = zip(*(column_values(data, col) for col in columns))
+    return [dict(zip(names, row)) for row in values]
+
+@app.route("/api/participants")
+def participants_api():
+    snap = workbook_snapshot()
+    query = participant_query()
+    offset, limit = 0, page_limit(PAGE_LIMIT)
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        digest, cursor_query, offset, cursor_limit = decode_cursor(cursor)
+        if query and query != cursor_query:
+            raise BadQuery("cursor was issued for a different query; drop the filters or the cursor")
+        if digest != snap.digest:
+            return jsonify(
+                error="Data changed since this cursor was issued; start again without a cursor",
+                digest=snap.digest,
+            ), 409
+        query = cursor_query
+        limit = page_limit(cursor_limit)
+
+    filters = {k: v for k, v in query.items() if k != "fields"}
+    data, team_col = participant_rows(snap, filters)
+    names, columns = participant_columns(team_col, query.get("fields", ""))
+
+    page = data.iloc[offset:offset + limit]
+    end = offset + len(page)
+
+    return jsonify(
+        digest=snap.digest,
+        total=len(data),
+        fields=names,
+        items=page_records(page, names, columns),
+        next_cursor=encode_cursor(snap.digest, query, end, limit) if end < len(data) else None,
+    )
+
+def export_chunks(data, columns):
+    for start in range(0, len(data), EXPORT_CHUNK):
+        chunk = data.iloc[start:start + EXPORT_CHUNK]
+        yield from zip(*(column_values(chunk, col) for col in columns))
+
+def csv_stream(names, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(names)
+    for i, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if i % EXPORT_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def xlsx_stream(names, rows):
+    # an .xlsx is a zip whose directory is written last, so rows are
+    # appended to a write-only workbook spooled in memory (or on disk
+    # past 8 MB) and the finished file is streamed out in blocks
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Participants")
+    ws.append(names)
+    for row in rows:
+        ws.append(list(row))
+
+    with tempfile.SpooledTemporaryFile(max_size=8 << 20) as f:
+        wb.save(f)
+        f.seek(0)
+        yield from iter(lambda: f.read(64 << 10), b"")
+
+EXPORT_FORMATS = {
+    "csv":  (csv_stream, "text/csv"),
+    "xlsx": (xlsx_stream, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+@app.route("/api/participants/export")
+def participants_export():
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        raise BadQuery(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    filters = participant_filters()
+    data, team_col = participant_rows(workbook_snapshot(), filters)
+    names, columns = participant_columns(team_col, request.args.get("fields", ""))
+
+    label = filters.get("sport") or filters.get("team_sport") or "all"
+    slug = re.sub(r"[^a-z0-9]+", "-", normalize(label)).strip("-") or "all"
+    filename = f"participants-{slug}.{fmt}"
+
+    stream, mimetype = EXPORT_FORMATS[fmt]
+    return Response(
+        stream(names, export_chunks(data, columns)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+# ============================================================
+# PARTICIPANT LOOKUP API
+# ------------------------------------------------------------
+#   /api/people?q=sidhnt        (typos are fine)
+#   /api/people?q=94343 81      (any part of the phone number)
+# Each match lists every individual sport and team event, with
+# the partner names from that event's team-members column.
+# ============================================================
+
+PEOPLE_LIMIT = 10
+MAX_PEOPLE_LIMIT = 50
+
+def participant_summary(snap, pos):
+    row = snap.df.iloc[pos]
+
+    teams = []
+    for part in str(row[COL_TEAM]).split(","):
+        label = part.strip()
+        if not label:
+            continue
+        team_norm = normalize(label)
+        # singles have no partners, but team_column_for() would point
+        # "badminton - singles" at the doubles column
+        team_col = None if "singles" in team_norm else team_column_for(
+            team_norm, snap.normalized_columns
+        )
+        teams.append({
+            "event": label,
+            "partners": str(row[team_col]).strip() if team_col else "",
+        })
+
+    return {
+        "name": str(row[COL_NAME]).strip(),
+        "phone": str(row[COL_PHONE]).strip(),
+        "branch": str(row[COL_BRANCH]),
+        "semester": str(row[COL_SEM]),
+        "gender": str(row[COL_GENDER]),
+        "sports": [p.strip() for p in str(row[COL_SPORT]).split(",") if p.strip()],
+        "team_events": teams,
+    }
+
+@app.route("/api/people")
+def people_api():
+    snap = workbook_snapshot()
+    query = request.args.get("q", "").strip()
+
+    limit = page_limit(PEOPLE_LIMIT, MAX_PEOPLE_LIMIT)
+
+    started = time.perf_counter()
+    rows, scores = snap.people.search(query, limit) if query else ([], [])
+    matches = [
+        dict(participant_summary(snap, pos), score=round(score, 3))
+        for pos, score in zip(rows, scores)
+    ]
+    elapsed = time.perf_counter() - started
+
+    return jsonify(
+        version=snap.version,
+        query=query,
+        elapsed_ms=round(elapsed * 1000, 3),
+        matches=matches,
+    )
+
+# ============================================================
+# RESULT CACHE
+# ------------------------------------------------------------
+# Hundreds of students refresh the same few sports pages and
+# the data changes rarely, so both the computed results and
+# the rendered page are kept in small LRU caches. Keys carry
+# the snapshot version, so a reload never serves stale pages;
+# old versions simply age out.
+# ============================================================
+
+class LRUCache:
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+# computed grouping/charts, keyed by (kind, normalized input, version)
+RESULT_CACHE = LRUCache(int(os.environ.get("SPORTS_DAY_RESULT_CACHE_SIZE", "64")))
+
+# rendered HTML + ETag, keyed by (kind, submitted label, version)
+PAGE_CACHE = LRUCache(int(os.environ.get("SPORTS_DAY_PAGE_CACHE_SIZE", "128")))
+
+# filtered, ordered frames behind /api/participants, keyed by (filters, version)
+PARTICIPANT_CACHE = LRUCache(int(os.environ.get("SPORTS_DAY_PARTICIPANT_CACHE_SIZE", "64")))
+
+# ============================================================
+# SEARCH HELPERS
+# ============================================================
+
+def team_base_key(team_norm):
+    # ✅ BASE SPORT FILTER (THIS FIXES EVERYTHING)
+    if "table tennis" in team_norm:
+        return "table tennis"
+    elif "badminton" in team_norm:
+        return "badminton"
+    elif "carrom" in team_norm:
+        return "carrom"
+    elif "relay" in team_norm:
+        return "relay"
+    return team_norm
+
+# canonical team-members field → header keywords
+TEAM_MEMBER_KEYWORDS = {
+    "relay":                ["relay", "team"],
+    "carrom":               ["carrom"],
+    "table tennis mixed":   ["table", "tennis", "mixed"],
+    "table tennis doubles": ["table", "tennis", "double"],
+    "badminton mixed":      ["badminton", "mixed"],
+    "badminton doubles":    ["badminton", "double"],
+}
+
+def team_member_field(team_norm):
+
+    # ================= RELAY =================
+    if "relay" in team_norm:
+        return "relay"
+
+    # ================= CARROM =================
+    elif "carrom" in team_norm:
+        return "carrom"
+
+    # ================= TABLE TENNIS MIXED =================
+    elif "table tennis" in team_norm and "mixed" in team_norm:
+        return "table tennis mixed"
+
+    # ================= TABLE TENNIS DOUBLES =================
+    elif "table tennis" in team_norm:
+        return "table tennis doubles"
+
+    # ================= BADMINTON MIXED =================
+    elif "badminton" in team_norm and "mixed" in team_norm:
+        return "badminton mixed"
+
+    # ================= BADMINTON DOUBLES =================
+    elif "badminton" in team_norm:
+        return "badminton doubles"
+
+    return None
+
+def team_column_for(team_norm, columns):
+    field = team_member_field(team_norm)
+    if field is None:
+        return None
+    return find_column_by_keywords(TEAM_MEMBER_KEYWORDS[field], columns)
+
+def chart_context(result, **extra):
+    with SEARCH_STAGE_SECONDS.time("group"):
+        grouped_data = group_by_branch(result)
+    with SEARCH_STAGE_SECONDS.time("charts"):
+        charts = dict(
+            programme_chart=programme_chart(result),
+            semester_chart=semester_chart(result),
+        )
+    return dict(grouped_data=grouped_data, **charts, **extra)
+
+def workbook_results(snap, kind, key):
+    if kind == "sport":
+        return individual_results(snap, key)
+    return team_results(snap, key)
+
+def individual_results(snap, key):
+    with SEARCH_STAGE_SECONDS.time("filter"):
+        filtered = snap.df.take(snap.sport_index.lookup(key))
 
         result = filtered[
             [COL_NAME, COL_SEM, COL_GENDER, COL_BRANCH, COL_PHONE]
         ]
+    return "", chart_context(result, team=False)
 
-        return render_template(
-            "result.html",
-            sport=individual,
-            grouped_data=group_by_branch(result),
-            team=False,
-            programme_chart=programme_chart(result),
-            semester_chart=semester_chart(result)
+def team_results(snap, team_norm):
+    with SEARCH_STAGE_SECONDS.time("filter"):
+        filtered = snap.df.take(snap.team_index.lookup(team_base_key(team_norm)))
+        team_col = team_column_for(team_norm, snap.normalized_columns)
+        details = bool(team_col) and team_col in snap.df.columns
+
+        columns = [COL_NAME, COL_SEM, COL_GENDER, COL_BRANCH, COL_PHONE]
+        result = filtered[columns + [team_col] if details else columns]
+
+    # ---------------- FAIL SAFE ----------------
+    if not details:
+        return " (team details not available in form)", chart_context(result, team=False)
+
+    # ---------------- TEAM MEMBERS OK ----------------
+    return "", chart_context(result, team=True, team_col=team_col)
+
+# ============================================================
+# SQLITE STORE (MULTIPLE EVENTS / CAMPUSES / YEARS)
+# ------------------------------------------------------------
+# `flask --app app ingest WORKBOOK --event SLUG ...` loads any
+# Google Form export into SPORTS_DAY_DB. Headers are matched
+# with the same normalize / find_column_by_keywords rules, and
+# every selected sport or team event becomes one indexed row in
+# `selections`, so a search only reads the matching rows.
+# Team members are keyed by TEAM_MEMBER_KEYWORDS field, so
+# workbooks with different headers can share one event.
+# Re-ingesting a workbook skips rows that are already stored.
+# ============================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id         INTEGER PRIMARY KEY,
+    slug       TEXT NOT NULL UNIQUE,
+    name       TEXT NOT NULL,
+    campus     TEXT NOT NULL DEFAULT '',
+    year       INTEGER,
+    version    INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS participants (
+    id           INTEGER PRIMARY KEY,
+    event_id     INTEGER NOT NULL REFERENCES events(id),
+    row_hash     TEXT NOT NULL,
+    name         TEXT NOT NULL,
+    phone        TEXT NOT NULL,
+    branch       TEXT NOT NULL,
+    semester     TEXT NOT NULL,
+    gender       TEXT NOT NULL,
+    team_members TEXT NOT NULL DEFAULT '{}',
+    UNIQUE (event_id, row_hash)
+);
+
+CREATE TABLE IF NOT EXISTS selections (
+    participant_id INTEGER NOT NULL REFERENCES participants(id),
+    event_id       INTEGER NOT NULL,
+    kind           TEXT NOT NULL,
+    sport          TEXT NOT NULL,
+    branch         TEXT NOT NULL,
+    semester       TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS selections_lookup
+    ON selections (event_id, kind, sport, branch, semester);
+
+CREATE TABLE IF NOT EXISTS options (
+    event_id INTEGER NOT NULL,
+    kind     TEXT NOT NULL,
+    sport    TEXT NOT NULL,
+    PRIMARY KEY (event_id, kind, sport)
+);
+
+-- team-members fields (TEAM_MEMBER_KEYWORDS keys) any workbook had
+CREATE TABLE IF NOT EXISTS team_fields (
+    event_id INTEGER NOT NULL,
+    field    TEXT NOT NULL,
+    PRIMARY KEY (event_id, field)
+);
+"""
+
+# canonical field → keyword alternatives, tried in order
+FIELD_KEYWORDS = {
+    "timestamp": [["timestamp"]],
+    "name":      [["full", "name"], ["your", "name"]],
+    "phone":     [["phone"], ["mobile"], ["contact"]],
+    "branch":    [["programme"], ["branch"], ["course"]],
+    "semester":  [["semester"]],
+    "gender":    [["gender"]],
+    "sport":     [["sports", "participate"], ["select", "sports"]],
+    "team":      [["sports", "team"]],
+}
+
+REQUIRED_FIELDS = ["name", "branch", "semester", "sport"]
+
+def resolve_fields(columns):
+    fields = {}
+    for field, alternatives in FIELD_KEYWORDS.items():
+        for keywords in alternatives:
+            col = find_column_by_keywords(keywords, columns)
+            if col:
+                fields[field] = col
+                break
+    missing = [f for f in REQUIRED_FIELDS if f not in fields]
+    if missing:
+        raise ValueError(f"Workbook has no column for: {', '.join(missing)}")
+    return fields
+
+def connect_store(path=DB_PATH):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def ingest_workbook(conn, path, slug, name=None, campus=None, year=None):
+    """Load one responses workbook into the store.
+
+    Returns ``(added, skipped)`` row counts.
+    """
+    df = pd.read_excel(path)
+    df.columns = df.columns.str.strip()
+    df = df.fillna("")
+
+    columns = {normalize(col): col for col in df.columns}
+    fields = resolve_fields(columns)
+    # team members are stored under the canonical field, not the
+    # header text, so workbooks with differing headers line up
+    member_cols = {
+        field: col for field in TEAM_MEMBER_KEYWORDS
+        if (col := team_column_for(field, columns))
+    }
+    hash_cols = [
+        fields[f] for f in ("timestamp", "name", "phone", "sport", "team")
+        if f in fields
+    ]
+
+    def value(row, field):
+        col = fields.get(field)
+        return str(row[col]) if col else ""
+
+    with conn:
+        # options given again for an existing event replace its metadata;
+        # omitted ones (None) keep what is stored
+        conn.execute(
+            """INSERT INTO events (slug, name, campus, year) VALUES (?, ?, ?, ?)
+               ON CONFLICT (slug) DO UPDATE SET
+                   name   = COALESCE(?, name),
+                   campus = COALESCE(?, campus),
+                   year   = COALESCE(?, year)""",
+            (slug, name or slug, campus or "", year, name, campus, year),
         )
+        event_id = conn.execute(
+            "SELECT id FROM events WHERE slug = ?", (slug,)
+        ).fetchone()["id"]
+
+        added = skipped = 0
+        for row in df.to_dict("records"):
+            row_hash = hashlib.sha1(
+                "\x1f".join(str(row[col]) for col in hash_cols).encode("utf-8")
+            ).hexdigest()
+            members = {
+                field: str(row[col]) for field, col in member_cols.items()
+                if row[col] != ""
+            }
+
+            cur = conn.execute(
+                """INSERT OR IGNORE INTO participants
+                   (event_id, row_hash, name, phone, branch, semester, gender, team_members)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (event_id, row_hash, value(row, "name"), value(row, "phone"),
+                 value(row, "branch"), value(row, "semester"), value(row, "gender"),
+                 json.dumps(members, ensure_ascii=False)),
+            )
+            if cur.rowcount == 0:
+                skipped += 1
+                continue
+            added += 1
+
+            selected = [("sport", e) for e in split_events(row[fields["sport"]])]
+            if "team" in fields:
+                selected += [("team", e) for e in split_events(row[fields["team"]])]
+
+            conn.executemany(
+                """INSERT INTO selections
+                   (participant_id, event_id, kind, sport, branch, semester)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [(cur.lastrowid, event_id, kind, sport,
+                  value(row, "branch"), value(row, "semester"))
+                 for kind, sport in selected],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO options (event_id, kind, sport) VALUES (?, ?, ?)",
+                [(event_id, kind, sport) for kind, sport in selected],
+            )
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO team_fields (event_id, field) VALUES (?, ?)",
+            [(event_id, field) for field in member_cols],
+        )
+        conn.execute(
+            """UPDATE events SET updated_at = ?, version = version + (? > 0)
+               WHERE id = ?""",
+            (time.time(), added, event_id),
+        )
+
+    return added, skipped
+
+@app.cli.command("ingest")
+@click.argument("workbooks", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--event", "slug", required=True, help="Event slug, e.g. tripura-2026")
+@click.option("--name", help="Display name (defaults to the slug)")
+@click.option("--campus", help="Campus name")
+@click.option("--year", type=int, help="Event year")
+@click.option("--db", default=DB_PATH or "sportsday.db", show_default=True)
+def ingest_command(workbooks, slug, name, campus, year, db):
+    """Load Google Form response workbooks into the SQLite store."""
+    conn = connect_store(db)
+    try:
+        for path in workbooks:
+            try:
+                added, skipped = ingest_workbook(conn, path, slug, name, campus, year)
+            except ValueError as exc:
+                raise click.ClickException(f"{path}: {exc}")
+            click.echo(f"{path}: {added} added, {skipped} already loaded")
+    finally:
+        conn.close()
+
+def get_store():
+    if "store" not in g:
+        # read-only, so a path that was never ingested is not created empty
+        uri = f"file:{quote(os.path.abspath(DB_PATH))}?mode=ro"
+        g.store = sqlite3.connect(uri, uri=True)
+        g.store.row_factory = sqlite3.Row
+    return g.store
+
+@app.teardown_appcontext
+def close_store(exc):
+    store = g.pop("store", None)
+    if store is not None:
+        store.close()
+
+def store_event(slug=None):
+    """The requested (or default) event, or None when it, or the
+    store itself, does not exist yet."""
+    try:
+        db = get_store()
+        if slug:
+            return db.execute("SELECT * FROM events WHERE slug = ?", (slug,)).fetchone()
+        if DEFAULT_EVENT:
+            return store_event(DEFAULT_EVENT)
+        return db.execute(
+            "SELECT * FROM events ORDER BY year DESC, updated_at DESC LIMIT 1"
+        ).fetchone()
+    except sqlite3.DatabaseError as exc:
+        app.logger.warning("SQLite store %s unavailable: %s", DB_PATH, exc)
+        return None
+
+def store_rows(event, kind, key, team_col=None):
+    """Participants of ``event`` whose ``kind`` selections contain ``key``,
+    as a frame with the same columns the workbook path uses."""
+    with SEARCH_STAGE_SECONDS.time("store_query"):
+        return _store_rows(event, kind, key, team_col)
+
+def _store_rows(event, kind, key, team_col):
+    db = get_store()
+    if key:
+        options = db.execute(
+            "SELECT sport FROM options WHERE event_id = ? AND kind = ?",
+            (event["id"], kind),
+        ).fetchall()
+        sports = [o["sport"] for o in options if key in o["sport"]]
+        marks = ",".join("?" * len(sports))
+        rows = db.execute(
+            f"""SELECT p.* FROM participants p
+                WHERE p.id IN (
+                    SELECT participant_id FROM selections
+                    WHERE event_id = ? AND kind = ? AND sport IN ({marks}))
+                ORDER BY p.id""",
+            (event["id"], kind, *sports),
+        ).fetchall()
+    else:
+        # an empty key matches everyone, like str.contains("")
+        rows = db.execute(
+            "SELECT * FROM participants WHERE event_id = ? ORDER BY id",
+            (event["id"],),
+        ).fetchall()
+
+    data = pd.DataFrame(
+        [[r["name"], r["semester"], r["gender"], r["branch"], r["phone"]] for r in rows],
+        columns=[COL_NAME, COL_SEM, COL_GENDER, COL_BRANCH, COL_PHONE],
+    )
+    if team_col:
+        data[team_col] = [json.loads(r["team_members"]).get(team_col, "") for r in rows]
+    return data
+
+def store_has_team_field(event, team_norm):
+    try:
+        return get_store().execute(
+            "SELECT 1 FROM team_fields WHERE event_id = ? AND field = ?",
+            (event["id"], team_member_field(team_norm)),
+        ).fetchone() is not None
+    except sqlite3.OperationalError:
+        # store ingested before team_fields existed; re-ingest into a new file
+        return False
+
+def store_results(event, kind, key):
+    if kind == "sport":
+        return "", chart_context(store_rows(event, "sport", key), team=False)
+
+    team_col = team_member_field(key) if store_has_team_field(event, key) else None
+    if not team_col:
+        result = store_rows(event, "team", team_base_key(key))
+        return " (team details not available in form)", chart_context(result, team=False)
+
+    result = store_rows(event, "team", team_base_key(key), team_col)
+    return "", chart_context(result, team=True, team_col=team_col)
+
+# ============================================================
+# SEARCH HANDLER
+# ------------------------------------------------------------
+# Accepts GET (cacheable, 304 on a matching If-None-Match)
+# as well as the original form POST. With SPORTS_DAY_DB set,
+# /search answers from the store's default event instead of
+# the workbook snapshot.
+# ============================================================
+
+def search_args():
+    individual = request.values.get("sport")
+    team = request.values.get("team_sport")
+
+    # --------------------------------------------------------
+    # INDIVIDUAL SPORTS
+    # --------------------------------------------------------
+    if individual:
+        return "sport", individual, normalize(individual).split("(")[0]
 
     # --------------------------------------------------------
     # TEAM SPORTS (FIXED)
     # --------------------------------------------------------
     if team:
-        team_norm = normalize(team)
-
-        # ✅ BASE SPORT FILTER (THIS FIXES EVERYTHING)
-        if "table tennis" in team_norm:
-            base_key = "table tennis"
-        elif "badminton" in team_norm:
-            base_key = "badminton"
-        elif "carrom" in team_norm:
-            base_key = "carrom"
-        elif "relay" in team_norm:
-            base_key = "relay"
-        else:
-            base_key = team_norm
+        return "team", team, normalize(team)
 
-        filtered = df[df["TEAM_NORM"].str.contains(base_key, na=False)]
+    return None
 
-        # ================= RELAY =================
-        if "relay" in team_norm:
-            team_col = find_column_by_keywords(["relay", "team"])
+def cached_page(scope, version, args, compute, **page):
+    kind, label, key = args
 
-        # ================= CARROM =================
-        elif "carrom" in team_norm:
-            team_col = find_column_by_keywords(["carrom"])
+    cached = PAGE_CACHE.get((scope, kind, label, version))
+    if cached is None:
+        results = RESULT_CACHE.get((scope, kind, key, version))
+        if results is None:
+            results = compute(kind, key)
+            RESULT_CACHE.put((scope, kind, key, version), results)
 
-        # ================= TABLE TENNIS MIXED =================
-        elif "table tennis" in team_norm and "mixed" in team_norm:
-            team_col = find_column_by_keywords(["table", "tennis", "mixed"])
+        note, context = results
+        with SEARCH_STAGE_SECONDS.time("render"):
+            html = render_template("result.html", sport=label + note, **page, **context)
+            etag = hashlib.sha256(html.encode("utf-8")).hexdigest()[:32]
+        cached = (html, etag)
+        PAGE_CACHE.put((scope, kind, label, version), cached)
 
-        # ================= TABLE TENNIS DOUBLES =================
-        elif "table tennis" in team_norm:
-            team_col = find_column_by_keywords(["table", "tennis", "double"])
+    html, etag = cached
+    response = make_response(html)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
-        # ================= BADMINTON MIXED =================
-        elif "badminton" in team_norm and "mixed" in team_norm:
-            team_col = find_column_by_keywords(["badminton", "mixed"])
+@app.route("/search", methods=["GET", "POST"])
+def search():
 
-        # ================= BADMINTON DOUBLES =================
-        elif "badminton" in team_norm:
-            team_col = find_column_by_keywords(["badminton", "double"])
+    args = search_args()
+    if args is None:
+        return "No sport selected"
 
-        else:
-            team_col = None
-
-        # ---------------- FAIL SAFE ----------------
-        if not team_col or team_col not in df.columns:
-            result = filtered[
-                [COL_NAME, COL_SEM, COL_GENDER, COL_BRANCH, COL_PHONE]
-            ]
-
-            return render_template(
-                "result.html",
-                sport=f"{team} (team details not available in form)",
-                grouped_data=group_by_branch(result),
-                team=False,
-                programme_chart=programme_chart(result),
-                semester_chart=semester_chart(result)
-            )
+    if DB_PATH:
+        event = store_event()
+        if event is not None:
+            return event_page(event, args, home_url=url_for("home"))
 
-        # ---------------- TEAM MEMBERS OK ----------------
-        result = filtered[
-            [COL_NAME, COL_SEM, COL_GENDER, COL_BRANCH, COL_PHONE, team_col]
-        ]
+    snap = workbook_snapshot()
+    return cached_page(
+        "workbook", snap.version, args,
+        lambda kind, key: workbook_results(snap, kind, key),
+    )
 
-        return render_template(
-            "result.html",
-            sport=team,
-            grouped_data=group_by_branch(result),
-            team=True,
-            team_col=team_col,
-            programme_chart=programme_chart(result),
-            semester_chart=semester_chart(result)
-        )
+@app.route("/cache/stats")
+def cache_stats():
+    return jsonify(
+        version=getattr(current_snapshot(), "version", None),
+        results=RESULT_CACHE.stats(),
+        pages=PAGE_CACHE.stats(),
+        participants=PARTICIPANT_CACHE.stats(),
+    )
+
+# ============================================================
+# EVENT ROUTES (SQLITE STORE)
+# ============================================================
+
+def event_or_404(slug):
+    if not DB_PATH:
+        abort(404)
+    event = store_event(slug)
+    if event is None:
+        abort(404)
+    return event
+
+def event_page(event, args, home_url=None):
+    return cached_page(
+        ("event", event["id"], home_url), event["version"], args,
+        lambda kind, key: store_results(event, kind, key),
+        home_url=home_url or url_for("event_home", slug=event["slug"]),
+    )
+
+@app.route("/events")
+def events():
+    if not DB_PATH:
+        return jsonify(events=[])
+    try:
+        rows = get_store().execute(
+            """SELECT e.slug, e.name, e.campus, e.year, e.version,
+                      (SELECT COUNT(*) FROM participants p WHERE p.event_id = e.id) AS participants
+               FROM events e ORDER BY e.year DESC, e.name"""
+        ).fetchall()
+    except sqlite3.DatabaseError:
+        rows = []
+    return jsonify(events=[dict(r) for r in rows])
+
+@app.route("/events/<slug>")
+def event_home(slug):
+    event = event_or_404(slug)
+    return render_template(
+        "index.html",
+        event_name=event["name"],
+        search_url=url_for("event_search", slug=slug),
+    )
+
+@app.route("/events/<slug>/search", methods=["GET", "POST"])
+def event_search(slug):
+    event = event_or_404(slug)
+    args = search_args()
+    if args is None:
+        return "No sport selected"
+    return event_page(event, args)
 
-    return "No sport selected"
+# ============================================================
+# REQUEST METRICS + /metrics
+# ============================================================
+
+@app.before_request
+def start_timer():
+    g._started = time.perf_counter()
+
+@app.after_request
+def record_request(response):
+    started = g.pop("_started", None)
+    endpoint = request.endpoint or "unknown"
+    if started is not None:
+        REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint)
+    RESPONSES.inc(endpoint, str(response.status_code))
+    return response
+
+@app.route("/metrics")
+def metrics():
+    snap = current_snapshot()
+    caches = {
+        "results": RESULT_CACHE.stats(),
+        "pages": PAGE_CACHE.stats(),
+        "participants": PARTICIPANT_CACHE.stats(),
+    }
+
+    lines = []
+    for metric in (REQUEST_SECONDS, RESPONSES, SEARCH_STAGE_SECONDS, LOAD_STAGE_SECONDS):
+        lines += metric.render()
+    if snap is not None:
+        lines += sample_lines(
+            "gauge", "sportsday_data_version", "Version of the loaded data snapshot.",
+            [((), (), snap.version)],
+        )
+        lines += sample_lines(
+            "gauge", "sportsday_data_rows", "Rows in the loaded data snapshot.",
+            [((), (), len(snap.df))],
+        )
+        lines += sample_lines(
+            "gauge", "sportsday_data_load_seconds", "Seconds taken to build the loaded snapshot.",
+            [((), (), snap.load_seconds)],
+        )
+    for field in ("hits", "misses", "evictions"):
+        lines += sample_lines(
+            "counter", f"sportsday_cache_{field}_total", f"LRU cache {field}.",
+            [(("cache",), (name,), stats[field]) for name, stats in caches.items()],
+        )
+    lines += sample_lines(
+        "gauge", "sportsday_cache_size", "Entries held in each LRU cache.",
+        [(("cache",), (name,), stats["size"]) for name, stats in caches.items()],
+    )
+    return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
 
 # ============================================================
 # RUN
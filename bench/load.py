@@ -0,0 +1,132 @@
+# ============================================================
+# SYNTHETIC LOAD BENCHMARK
+# ------------------------------------------------------------
+# For each workbook size, in a fresh process:
+#   load     – cold start (parse + write cache), warm start
+#              (columnar cache) and peak RSS
+#   search   – p50 / p99 latency of every option on the home
+#              page, uncached (caches cleared per request) and
+#              cached (page cache hit)
+#   stages   – mean time per /search stage on cache misses,
+#              read back from the /metrics histograms
+#
+#   python -m bench.load [rounds] [rows ...]
+#   python -m bench.load 5 1000 100000 1000000
+# ============================================================
+
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.synth import write_workbook
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), "..", "templates", "index.html")
+SELECT_RE = re.compile(r'<select name="(\w+)".*?>(.*?)</select>', re.S)
+OPTION_RE = re.compile(r'<option value="([^"]+)"')
+
+def form_options():
+    with open(TEMPLATE, encoding="utf-8") as f:
+        html = f.read()
+    return [
+        (field, value)
+        for field, body in SELECT_RE.findall(html)
+        for value in OPTION_RE.findall(body)
+    ]
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[round(p * (len(ordered) - 1))]
+
+def timed_search(client, field, value):
+    started = time.perf_counter()
+    response = client.get("/search", query_string={field: value})
+    elapsed = time.perf_counter() - started
+    assert response.status_code == 200, (field, value, response.status_code)
+    return elapsed
+
+def worker(rounds):
+    import app  # cold: parses the workbook and writes the cache
+
+    cold = app.current_snapshot().load_seconds
+    warm = app.load_snapshot().load_seconds
+
+    client = app.app.test_client()
+    options = form_options()
+
+    uncached = []
+    for _ in range(rounds):
+        for field, value in options:
+            app.RESULT_CACHE.clear()
+            app.PAGE_CACHE.clear()
+            uncached.append(timed_search(client, field, value))
+
+    stages = {
+        labels[0]: total / count
+        for labels, (total, count) in app.SEARCH_STAGE_SECONDS.totals().items()
+    }
+
+    for field, value in options:
+        timed_search(client, field, value)  # prime the page cache
+    cached = [
+        timed_search(client, field, value)
+        for _ in range(rounds)
+        for field, value in options
+    ]
+
+    json.dump({
+        "rows": len(app.current_snapshot().df),
+        "cold": cold,
+        "warm": warm,
+        "rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "uncached": [percentile(uncached, 0.5), percentile(uncached, 0.99)],
+        "cached": [percentile(cached, 0.5), percentile(cached, 0.99)],
+        "stages": stages,
+    }, sys.stdout)
+
+def run(rows, rounds, tmp):
+    workbook = write_workbook(os.path.join(tmp, f"responses-{rows}.xlsx"), rows)
+    env = dict(os.environ, SPORTS_DAY_EXCEL=workbook,
+               SPORTS_DAY_RELOAD_INTERVAL="0",
+               SPORTS_DAY_DB="",
+               SPORTS_DAY_CACHE_DIR=os.path.join(tmp, f"cache-{rows}"))
+    out = subprocess.run(
+        [sys.executable, "-m", "bench.load", "--worker", str(rounds)],
+        env=env, check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    return json.loads(out)
+
+def ms(seconds):
+    return f"{seconds * 1000:.2f}"
+
+def main(rounds, sizes):
+    tmp = tempfile.mkdtemp(prefix="sportsday-load-")
+    results = [run(rows, rounds, tmp) for rows in sizes]
+
+    print(f"{len(form_options())} search options x {rounds} rounds")
+    print(f"{'rows':>8} {'cold (s)':>9} {'warm (s)':>9} {'RSS (MiB)':>10}"
+          f" {'miss p50':>9} {'miss p99':>9} {'hit p50':>8} {'hit p99':>8}  (ms)")
+    for r in results:
+        print(f"{r['rows']:>8} {r['cold']:>9.2f} {r['warm']:>9.2f} {r['rss_mib']:>10.1f}"
+              f" {ms(r['uncached'][0]):>9} {ms(r['uncached'][1]):>9}"
+              f" {ms(r['cached'][0]):>8} {ms(r['cached'][1]):>8}")
+
+    print()
+    print("mean ms per /search stage (cache misses)")
+    stages = sorted({s for r in results for s in r["stages"]})
+    print(f"{'rows':>8} " + " ".join(f"{s:>9}" for s in stages))
+    for r in results:
+        print(f"{r['rows']:>8} " + " ".join(
+            f"{ms(r['stages'].get(s, 0.0)):>9}" for s in stages
+        ))
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        worker(int(sys.argv[2]))
+    else:
+        args = [int(a) for a in sys.argv[1:]]
+        main(args[0] if args else 5, args[1:] or [1000, 100000, 1000000])
@@ -0,0 +1,64 @@
+# ============================================================
+# PARTICIPANT LOOKUP BENCHMARK
+# ------------------------------------------------------------
+# Builds the trigram PeopleIndex over a synthetic sheet and
+# times typeahead-style queries (every prefix of a few names,
+# typos, partial phone numbers) end to end through the API
+# summary, reporting p50 / p99 / max per query.
+#
+#   python -m bench.people [rows]
+# ============================================================
+
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("SPORTS_DAY_RELOAD_INTERVAL", "0")
+
+import app
+from bench.pipeline import synthetic_frame
+
+def queries(df, rng):
+    names = df[app.COL_NAME].str.strip().tolist()
+    phones = [str(p) for p in df[app.COL_PHONE].tolist() if p != ""]
+
+    for name in rng.choice(names, 20):
+        for i in range(1, len(name) + 1):
+            yield name[:i]
+        # drop one letter to simulate a typo
+        cut = rng.integers(1, len(name) - 1)
+        yield name[:cut] + name[cut + 1:]
+
+    for phone in rng.choice(phones, 50):
+        start = rng.integers(0, 5)
+        yield phone[start:start + rng.integers(3, 7)]
+
+def main(rows):
+    df = synthetic_frame(rows)
+    snap_fields = dict(app.current_snapshot()._asdict())
+
+    started = time.perf_counter()
+    people = app.PeopleIndex(df)
+    build = time.perf_counter() - started
+
+    snap = app.DataSnapshot(**dict(
+        snap_fields, df=df, people=people,
+        normalized_columns={app.normalize(c): c for c in df.columns},
+    ))
+
+    timings = []
+    for query in queries(df, np.random.default_rng(7)):
+        started = time.perf_counter()
+        found, _ = people.search(query, 10)
+        [app.participant_summary(snap, pos) for pos in found]
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings = np.array(timings)
+    print(f"{rows} rows, index built in {build:.2f}s, {len(timings)} queries")
+    print(f"p50 {np.percentile(timings, 50):.2f} ms  "
+          f"p99 {np.percentile(timings, 99):.2f} ms  max {timings.max():.2f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
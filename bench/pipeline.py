@@ -0,0 +1,95 @@
+# ============================================================
+# NORMALIZATION / GROUPING BENCHMARK
+# ------------------------------------------------------------
+# Compares the original per-row pipeline (Series.apply with
+# re.sub, per-row semester_key, to_dict loop for SNO) with the
+# vectorised one in app.py on an in-memory synthetic sheet,
+# and checks both produce identical output.
+#
+#   python -m bench.pipeline [rows]
+# ============================================================
+
+import os
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import pandas as pd
+
+os.environ.setdefault("SPORTS_DAY_RELOAD_INTERVAL", "0")
+
+import app
+from bench.synth import HEADERS, fake_row
+
+# ---------------- ORIGINAL IMPLEMENTATION ----------------
+
+def legacy_normalize(text):
+    text = str(text).lower()
+    text = text.replace("–", "-")
+    text = re.sub(r"[^\w\s\-]", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+def legacy_semester_key(val):
+    val = legacy_normalize(val).replace("semester", "")
+    return app.SEM_MAP.get(val, 99)
+
+def legacy_group_by_branch(data):
+    data = data.copy()
+    data["_SEM_KEY"] = data[app.COL_SEM].apply(legacy_semester_key)
+    data = data.sort_values("_SEM_KEY")
+
+    grouped = defaultdict(list)
+    for branch, rows in data.groupby(app.COL_BRANCH):
+        for i, row in enumerate(rows.to_dict("records"), start=1):
+            row["SNO"] = i
+            grouped[branch].append(row)
+
+    return dict(grouped)
+
+# ---------------------------------------------------------
+
+def synthetic_frame(rows, seed=2026):
+    rng = random.Random(seed)
+    start = datetime(2026, 2, 4, 11, 55)
+    df = pd.DataFrame(
+        [fake_row(rng, i, start) for i in range(rows)],
+        columns=[h.strip() for h in HEADERS],
+    )
+    return df.fillna("")
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+def main(rows):
+    df = synthetic_frame(rows)
+    cols = [app.COL_NAME, app.COL_SEM, app.COL_GENDER, app.COL_BRANCH, app.COL_PHONE]
+    stages = [
+        ("normalize sports", lambda: df[app.COL_SPORT].apply(legacy_normalize),
+                             lambda: app.normalize_series(df[app.COL_SPORT])),
+        ("normalize teams",  lambda: df[app.COL_TEAM].apply(legacy_normalize),
+                             lambda: app.normalize_series(df[app.COL_TEAM])),
+        ("semester keys",    lambda: df[app.COL_SEM].apply(legacy_semester_key),
+                             lambda: app.semester_keys(df[app.COL_SEM])),
+        ("group_by_branch",  lambda: legacy_group_by_branch(df[cols]),
+                             lambda: app.group_by_branch(df[cols])),
+    ]
+
+    print(f"{rows} rows")
+    print(f"{'stage':<18} {'per-row (s)':>12} {'vectorised (s)':>15} {'speedup':>8}")
+    for name, legacy, vectorised in stages:
+        expected, t_old = timed(legacy)
+        actual, t_new = timed(vectorised)
+        if isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected, actual)
+        else:
+            assert expected == actual, f"{name}: output differs"
+        print(f"{name:<18} {t_old:>12.3f} {t_new:>15.3f} {t_old / t_new:>7.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
@@ -0,0 +1,105 @@
+# ============================================================
+# WORKER STARTUP BENCHMARK
+# ------------------------------------------------------------
+# Time until N workers have the data loaded and can serve,
+# plus their combined proportional memory (PSS), for:
+#   parse    – every worker parses the workbook (no cache)
+#   cache    – every worker maps the warm columnar cache
+#   preload  – one master loads the cache, then forks workers
+#
+#   python -m bench.startup [rows] [workers ...]
+#   python -m bench.startup 20000 1 4 16
+# ============================================================
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.synth import write_workbook
+
+def pss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def serve_ready():
+    # the cheapest real request: proves the snapshot is usable
+    import app
+    app.app.test_client().post("/search", data={"sport": "Cricket"})
+    sys.stdout.write(f"{os.getpid()}\n")
+    sys.stdout.flush()
+    sys.stdin.read()
+
+def preload_master(workers):
+    import app  # noqa: F401  (loads the snapshot before forking)
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            serve_ready()
+            os._exit(0)
+        children.append(pid)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+def run(mode, workers, env):
+    started = time.perf_counter()
+    if mode == "preload":
+        cmd = [sys.executable, "-m", "bench.startup", "--master", str(workers)]
+        procs = [subprocess.Popen(cmd, env=env, stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, text=True)]
+        pids = [int(procs[0].stdout.readline()) for _ in range(workers)]
+        pids.append(procs[0].pid)
+    else:
+        cmd = [sys.executable, "-m", "bench.startup", "--worker"]
+        procs = [subprocess.Popen(cmd, env=env, stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, text=True)
+                 for _ in range(workers)]
+        pids = [int(p.stdout.readline()) for p in procs]
+
+    elapsed = time.perf_counter() - started
+    memory = sum(pss_kb(pid) for pid in pids) / 1024
+
+    for p in procs:
+        p.stdin.close()
+        p.wait()
+    return elapsed, memory
+
+def main(rows, worker_counts):
+    tmp = tempfile.mkdtemp(prefix="sportsday-bench-")
+    workbook = write_workbook(os.path.join(tmp, "responses.xlsx"), rows)
+
+    base = dict(os.environ, SPORTS_DAY_EXCEL=workbook,
+                SPORTS_DAY_RELOAD_INTERVAL="0",
+                SPORTS_DAY_CACHE_DIR=os.path.join(tmp, "cache"))
+    modes = {
+        "parse": dict(base, SPORTS_DAY_CACHE_DIR=""),
+        "cache": base,
+        "preload": base,
+    }
+
+    # warm the cache once so "cache" and "preload" measure reads only
+    subprocess.run([sys.executable, "-c", "import app"], env=base, check=True)
+
+    print(f"{rows} rows")
+    print(f"{'mode':<8} {'workers':>7} {'ready (s)':>10} {'PSS (MiB)':>10}")
+    for workers in worker_counts:
+        for mode, env in modes.items():
+            elapsed, memory = run(mode, workers, env)
+            print(f"{mode:<8} {workers:>7} {elapsed:>10.2f} {memory:>10.1f}")
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        serve_ready()
+    elif sys.argv[1:2] == ["--master"]:
+        preload_master(int(sys.argv[2]))
+    else:
+        args = [int(a) for a in sys.argv[1:]]
+        main(args[0] if args else 20000, args[1:] or [1, 4, 16])
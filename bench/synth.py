@@ -0,0 +1,124 @@
+# ============================================================
+# SYNTHETIC RESPONSES WORKBOOK
+# ------------------------------------------------------------
+# Writes a workbook shaped like the Google Form export: same
+# messy headers (stray spaces, en dashes, the empty "G" column),
+# emoji multi-select cells and team-member free text.
+#
+#   python -m bench.synth 100000 /tmp/responses-100k.xlsx
+# ============================================================
+
+import random
+import sys
+from datetime import datetime, timedelta
+
+from openpyxl import Workbook
+
+HEADERS = [
+    "Timestamp",
+    "  Full Name  ",
+    "Email ID ",
+    "Phone Number ",
+    "Programme / Branch ",
+    "Semester ",
+    "  Department / School  ",
+    "  Select the Sports You Want to Participate In  ",
+    "  Are You the Team Leader?  ",
+    " Sports ( Team)",
+    "Enter Names of Team Members (Badminton – Doubles)",
+    "Enter Names of Team Members ( Badminton – Mixed Doubles)",
+    "Enter Names of Team Members (Table Tennis –Doubles)",
+    "Enter Names of Team Members (Table Tennis –  Mixed Doubles)",
+    "Enter Names of Team Members (Relay Race  Team of 4 :Consisting of 2 Males and 2 Females)",
+    "Enter Names of Team Members (Carrom - Doubles or Mix Double)",
+    "Email address",
+    "G",
+    "Gender",
+    "Arjha Debbarma",
+]
+
+SPORTS = [
+    "🏃 Athletics – Sprint (100 m)", "🏃 Athletics – Long Run (1600 m)",
+    "🔁 Relay Race (4×100 m)", "🏏 Cricket", "⚽ Football", "🏐 Volleyball",
+    "🏸 Badminton", "🏓 Table Tennis", "🪢 Tug of War", "🎯 Shot Put",
+    "⚃ Carrom", "🤾Throw Ball( only for girls)", "♟️Chess", "🎲Chinese Checker",
+]
+
+# team choice → index of the header holding the partner names
+TEAM_SPORTS = {
+    "🏸 Badminton – Doubles": 10,
+    "🏸 Badminton – Mixed Doubles": 11,
+    "🏸 Badminton – Singles": None,
+    "🏓 Table Tennis – Singles": None,
+    "🏓 Table Tennis– Mixed Doubles": 13,
+    "🏓 Table Tennis – Doubles": 12,
+    "🔁Relay Race (Team of 4)": 14,
+    "Carrom (Doubles or Mix Double)": 15,
+    "Carrom (Singles)": None,
+}
+
+PROGRAMMES = {
+    "B.Tech–M.Tech": "School of Cybersecurity and Digital Forensics",
+    "B.Sc–M.Sc": "School of Forensic Science",
+    "M.Sc Forensic Science": "School of Forensic Science",
+}
+
+SEMESTERS = ["Semester II", "Semester IV", "Semester VI", "Semester VIII", "Semester X"]
+
+FIRST = ["Aarav", "Ananya", "Rohit", "Priya", "Sidhant", "Shreya", "Raunak",
+         "Harshita", "Tridip", "Arjha", "Dwaipayan", "Antar", "Kavya", "Parag"]
+LAST = ["Debbarma", "Yadav", "Majumder", "Mondal", "Kori", "Baksi", "Pandey",
+        "Gaur", "Sarawgi", "Raj", "Das", "Sharma", "Singh", "Roy"]
+
+SYLLABLES = ["ra", "sha", "vi", "ni", "ka", "de", "pri", "an", "ru", "ma",
+             "ta", "jit", "ya", "shu", "lo", "dip", "mon", "sa", "ha", "ri"]
+
+def fake_name(rng):
+    # tens of thousands of distinct names, like a real multi-year archive
+    first = rng.choice(FIRST) if rng.random() < 0.3 else (
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title()
+    )
+    middle = f" {rng.choice(FIRST)}" if rng.random() < 0.2 else ""
+    return f"{first}{middle} {rng.choice(LAST)}"
+
+def fake_row(rng, i, start):
+    name = fake_name(rng)
+    branch = rng.choice(list(PROGRAMMES))
+    gender = rng.choice(["Male", "Male", "Female"])
+    sports = rng.sample(SPORTS, rng.randint(1, 5))
+    teams = rng.sample(list(TEAM_SPORTS), rng.choice([0, 0, 1, 2, 3]))
+
+    row = [""] * len(HEADERS)
+    row[0] = start + timedelta(seconds=37 * i)
+    row[1] = name + rng.choice(["", " "])
+    row[2] = f"{name.lower().replace(' ', '.')}{i}@tr.nfsu.edu.in"
+    row[3] = rng.randint(6000000000, 9999999999) if rng.random() > 0.02 else ""
+    row[4] = branch
+    row[5] = rng.choice(SEMESTERS)
+    row[6] = PROGRAMMES[branch]
+    row[7] = ", ".join(s for s in SPORTS if s in sports)
+    row[8] = rng.choice(["Yes", "No"])
+    row[9] = ", ".join(teams)
+    for team in teams:
+        col = TEAM_SPORTS[team]
+        if col is not None:
+            size = 3 if col == 14 else 1
+            row[col] = ", ".join(fake_name(rng) for _ in range(size))
+    row[16] = row[2]
+    row[18] = gender
+    return [None if v == "" else v for v in row]
+
+def write_workbook(path, rows, seed=2026):
+    rng = random.Random(seed)
+    start = datetime(2026, 2, 4, 11, 55)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Form Responses 1")
+    ws.append(HEADERS)
+    for i in range(rows):
+        ws.append(fake_row(rng, i, start))
+    wb.save(path)
+    return path
+
+if __name__ == "__main__":
+    write_workbook(sys.argv[2], int(sys.argv[1]))
@@ -0,0 +1,31 @@
+# ============================================================
+# GUNICORN CONFIG
+# ------------------------------------------------------------
+# preload_app imports app.py once in the master: the workbook
+# is loaded (from the .cache columnar files when the source is
+# unchanged) before forking, and workers share those pages
+# copy-on-write instead of each building their own frame.
+# Set SPORTS_DAY_PRELOAD=0 to load per worker again.
+#
+# The sharing only lasts until the workbook changes. Each
+# worker's watcher then re-hashes the file and builds its own
+# private snapshot, so after the first hot reload memory is
+# back to one frame per worker. The master keeps the old data:
+# workers respawned later (including on HUP) fork from it and
+# reload again. To get sharing back, restart gunicorn fully
+# (or upgrade with USR2) after the workbook changes; with
+# SPORTS_DAY_RELOAD_INTERVAL=0 that restart is the only way
+# new data is picked up.
+# ============================================================
+
+import os
+
+preload_app = os.environ.get("SPORTS_DAY_PRELOAD", "1") == "1"
+
+# The hot-reload thread must not run in the master: it would not
+# survive the fork, and forking while it holds a lock is unsafe.
+os.environ.setdefault("SPORTS_DAY_WATCH_ON_IMPORT", "0")
+
+def post_fork(server, worker):
+    import app
+    app.start_watcher()
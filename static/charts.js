@@ -2,20 +2,29 @@
    NFSU SPORTS DAY – CHARTS (FINAL CLEAN VERSION)
 ===================================================== */
 
+/* ---------- COLORS ---------- */
+const COLORS = [
+    "#1a237e", "#42a5f5", "#ffeb3b",
+    "#66bb6a", "#ff7043", "#ab47bc"
+];
+
 document.addEventListener("DOMContentLoaded", () => {
 
     const dataBox = document.getElementById("chartData");
-    if (!dataBox) return;
+    if (dataBox) renderResultCharts(dataBox);
+
+    const dashboard = document.getElementById("cubeDashboard");
+    if (dashboard) renderDashboard(dashboard);
+});
+
+/* =====================================================
+   RESULT PAGE CHARTS
+===================================================== */
+function renderResultCharts(dataBox) {
 
     const programmeData = JSON.parse(dataBox.dataset.programme || "{}");
     const semesterData  = JSON.parse(dataBox.dataset.semester || "{}");
 
-    /* ---------- COLORS ---------- */
-    const COLORS = [
-        "#1a237e", "#42a5f5", "#ffeb3b",
-        "#66bb6a", "#ff7043", "#ab47bc"
-    ];
-
     /* =====================================================
        PIE CHART – PROGRAMME
     ===================================================== */
@@ -113,4 +122,116 @@ document.addEventListener("DOMContentLoaded", () => {
             }
         });
     }
-});
+}
+
+/* =====================================================
+   DASHBOARD – FED FROM /api/cube
+===================================================== */
+function renderDashboard(box) {
+
+    const api       = box.dataset.api;
+    const rowsSel   = document.getElementById("cubeRows");
+    const splitSel  = document.getElementById("cubeSplit");
+    const filters   = box.querySelectorAll(".cube-filter");
+    const totalBox  = document.getElementById("cubeTotal");
+
+    let barChart = null;
+    let pieChart = null;
+
+    /* ---------- FILTER OPTIONS ---------- */
+    fetch(api + "/dimensions")
+        .then(res => res.json())
+        .then(meta => {
+            filters.forEach(sel => {
+                (meta.dimensions[sel.dataset.dim] || []).forEach(label => {
+                    sel.add(new Option(label, label));
+                });
+            });
+            refresh();
+        });
+
+    rowsSel.addEventListener("change", refresh);
+    splitSel.addEventListener("change", refresh);
+    filters.forEach(sel => sel.addEventListener("change", refresh));
+
+    function query(group) {
+        const params = new URLSearchParams({ group: group.join(",") });
+        filters.forEach(sel => {
+            if (sel.value) params.append(sel.dataset.dim, sel.value);
+        });
+        return fetch(api + "?" + params).then(res => res.json());
+    }
+
+    function refresh() {
+        const rowDim   = rowsSel.value;
+        const splitDim = splitSel.value && splitSel.value !== rowDim ? splitSel.value : "";
+        const group    = splitDim ? [rowDim, splitDim] : [rowDim];
+
+        query(group).then(data => {
+            totalBox.textContent = `${data.total} entries`;
+            drawBar(data.rows, rowDim, splitDim);
+        });
+
+        query([splitDim || rowDim]).then(data => {
+            drawPie(data.rows, splitDim || rowDim);
+        });
+    }
+
+    /* ---------- STACKED BAR ---------- */
+    function drawBar(rows, rowDim, splitDim) {
+        const labels = [...new Set(rows.map(r => r[rowDim]))];
+        const series = splitDim ? [...new Set(rows.map(r => r[splitDim]))] : ["Entries"];
+
+        const datasets = series.map((name, i) => ({
+            label: name,
+            data: labels.map(label => {
+                const row = rows.find(r =>
+                    r[rowDim] === label && (!splitDim || r[splitDim] === name));
+                return row ? row.count : 0;
+            }),
+            backgroundColor: COLORS[i % COLORS.length],
+            borderRadius: 6
+        }));
+
+        if (barChart) barChart.destroy();
+        barChart = new Chart(document.getElementById("cubeBarChart"), {
+            type: "bar",
+            data: { labels, datasets },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                scales: {
+                    x: { stacked: true, ticks: { color: "#000" }, grid: { display: false } },
+                    y: { stacked: true, beginAtZero: true, ticks: { color: "#000" } }
+                },
+                plugins: {
+                    legend: { display: Boolean(splitDim), position: "bottom" }
+                }
+            }
+        });
+    }
+
+    /* ---------- PIE ---------- */
+    function drawPie(rows, dim) {
+        if (pieChart) pieChart.destroy();
+        pieChart = new Chart(document.getElementById("cubePieChart"), {
+            type: "pie",
+            data: {
+                labels: rows.map(r => r[dim]),
+                datasets: [{
+                    data: rows.map(r => r.count),
+                    backgroundColor: COLORS,
+                    borderColor: "#ffffff",
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: { position: "bottom", labels: { color: "#000" } }
+                }
+            }
+        });
+    }
+}
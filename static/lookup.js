@@ -0,0 +1,75 @@
+/* =====================================================
+   NFSU SPORTS DAY – PARTICIPANT LOOKUP (TYPEAHEAD)
+===================================================== */
+
+document.addEventListener("DOMContentLoaded", () => {
+
+    const input   = document.getElementById("lookupQuery");
+    const results = document.getElementById("lookupResults");
+    if (!input || !results) return;
+
+    const api = results.dataset.api;
+    let timer = null;
+    let latest = 0;
+
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(search, 150);
+    });
+
+    function search() {
+        const query = input.value.trim();
+        const ticket = ++latest;
+
+        if (!query) {
+            results.replaceChildren();
+            return;
+        }
+
+        fetch(api + "?" + new URLSearchParams({ q: query }))
+            .then(res => res.json())
+            .then(data => {
+                // ignore answers to queries the user has already typed past
+                if (ticket === latest) render(data.matches);
+            });
+    }
+
+    /* ---------- RESULT CARDS ---------- */
+    function render(matches) {
+        results.replaceChildren(...matches.map(person => {
+            const li = document.createElement("li");
+
+            const name = document.createElement("strong");
+            name.textContent = person.name;
+
+            const meta = document.createElement("span");
+            meta.className = "meta";
+            meta.textContent =
+                `${person.branch} • ${person.semester} • ${person.gender} • ${person.phone}`;
+
+            li.append(name, meta);
+
+            if (person.sports.length) {
+                const sports = document.createElement("div");
+                sports.textContent = "Sports: " + person.sports.join(", ");
+                li.append(sports);
+            }
+
+            person.team_events.forEach(team => {
+                const row = document.createElement("div");
+                row.textContent = team.partners
+                    ? `${team.event} – with ${team.partners}`
+                    : team.event;
+                li.append(row);
+            });
+
+            return li;
+        }));
+
+        if (!matches.length) {
+            const li = document.createElement("li");
+            li.textContent = "No participant found";
+            results.append(li);
+        }
+    }
+});